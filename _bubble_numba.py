@@ -0,0 +1,53 @@
+# _bubble_numba.py
+
+"""
+Optional Numba-compiled bubble sort kernel used by bubble_sort_in_place.
+
+Importing this module requires numpy and numba. bubble_sort.py only loads it
+when the Cython build is absent and the caller has already imported numba,
+since importing numba costs more than a pure-Python bubble sort of any list
+that reaches the kernel.
+"""
+import array
+
+import numpy as np
+from numba import njit
+
+@njit(cache=True)
+def bubble_kernel(a, reverse):
+    """
+    Cocktail-shaker sort a 1-D int64/float64 array in place.
+
+    Numba compiles one specialization per dtype, so the same body serves
+    both the int64 and float64 cases. Strict comparisons keep it stable.
+    """
+    lo, hi = 0, a.shape[0] - 1
+    while lo < hi:
+        last = lo
+        for i in range(lo, hi):
+            if (a[i] < a[i + 1]) if reverse else (a[i] > a[i + 1]):
+                t = a[i]
+                a[i] = a[i + 1]
+                a[i + 1] = t
+                last = i
+        hi = last
+        last = hi
+        for i in range(hi - 1, lo - 1, -1):
+            if (a[i] < a[i + 1]) if reverse else (a[i] > a[i + 1]):
+                t = a[i]
+                a[i] = a[i + 1]
+                a[i + 1] = t
+                last = i + 1
+        lo = last
+
+def sort_packed(packed: "array.array", reverse: bool) -> None:
+    """
+    Sort an array.array of typecode 'q' (int64) or 'd' (float64) in place.
+
+    The kernel works on a NumPy view of the array's buffer, so no copy is made.
+
+    Args:
+        packed: The array to sort, as built by bubble_sort._maybe_pack.
+        reverse: If True, sort in descending order.
+    """
+    bubble_kernel(np.frombuffer(packed, dtype=packed.typecode), reverse)
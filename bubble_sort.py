@@ -9,20 +9,63 @@ Concise, readable bubble sort with minimal surface area:
 
 There are helpful TypeError messages for non-iterable inputs and
 non-comparable elements while keeping the implementation compact.
+
+Lists over _BUBBLE_MAX_N items are handed to the built-in Timsort, and
+homogeneous int/float lists can use an optional Cython or Numba kernel.
 """
-from typing import Iterable, List, Any
+from typing import Iterable, List, Any, Callable, Optional
+from collections.abc import Sized
+from itertools import islice
+from operator import ge, le
 import argparse
+import array
+import bisect
+import csv
+import functools
+import heapq
+import os
+import re
 import sys
 
 __all__ = ["bubble_sort", "bubble_sort_in_place"]
 
+# Token shapes accepted by int() and float() (signs, "_" digit separators,
+# exponents, inf/nan), so _parse_token can classify without raising.
+_DIGITS = r"\d+(?:_\d+)*"
+_INT_RE = re.compile(rf"[-+]?{_DIGITS}")
+_FLOAT_RE = re.compile(
+    rf"[-+]?(?:(?:{_DIGITS}\.(?:{_DIGITS})?|\.{_DIGITS}|{_DIGITS})(?:[eE][-+]?{_DIGITS})?"
+    r"|inf(?:inity)?|nan)",
+    re.IGNORECASE,
+)
+
+# Above this many items the O(n^2) bubble passes are never worth running in the
+# interpreter; the list is handed to CPython's C-implemented Timsort instead,
+# which is also stable and gives the same result.
+_BUBBLE_MAX_N = 1_000
+
+# Below this many items packing the list for a compiled kernel and copying it
+# back outweighs what the kernel saves, so short lists stay on the
+# pure-Python loop.
+_COMPILED_MIN_N = 64
+
+# Up to this many items bubble_sort's copying path builds its result with
+# bisect.insort, whose binary search and element shifting both run in C.
+_SMALL_N = 64
+
+# Smallest input worth scattering across worker processes; below it, process
+# start-up and pickling the chunks cost more than a single Timsort call.
+_PARALLEL_MIN_N = 1_000_000
+
 def _parse_token(tok: str) -> Any:
     """
     Convert a CLI token to int or float when possible, otherwise return
     the stripped string.
 
     This helper keeps the CLI friendly to numeric inputs while preserving
-    lexicographic sorting for non-numeric tokens.
+    lexicographic sorting for non-numeric tokens. Tokens are classified with
+    precompiled regexes instead of trial int()/float() calls, so non-numeric
+    tokens do not pay for raising and catching exceptions.
 
     Args:
         tok: Raw token string from CLI or interactive input.
@@ -31,19 +74,264 @@ def _parse_token(tok: str) -> Any:
         int | float | str: Parsed value.
     """
     t = tok.strip()
-    for conv in (int, float):
+    if _INT_RE.fullmatch(t):
         try:
-            return conv(t)
-        except Exception:
-            continue
+            return int(t)
+        except ValueError:
+            # Over sys.get_int_max_str_digits(); float() still parses it.
+            pass
+    if _FLOAT_RE.fullmatch(t):
+        return float(t)
     return t
 
+def _timsort_in_place(arr: List[Any], reverse: bool) -> None:
+    """
+    Sort arr in place with list.sort, keeping the module's TypeError wording.
+
+    Args:
+        arr: The list to sort.
+        reverse: If True, sort in descending order.
+
+    Raises:
+        TypeError: If two elements cannot be compared.
+    """
+    try:
+        arr.sort(reverse=reverse)
+    except TypeError as exc:
+        raise TypeError(f"Cannot compare elements: {exc}") from exc
+
+def _sort_chunk(reverse: bool, chunk: List[Any]) -> List[Any]:
+    """Sort one chunk in a _parallel_sort worker and return it."""
+    _timsort_in_place(chunk, reverse)
+    return chunk
+
+def _parallel_sort(arr: List[Any], reverse: bool) -> List[Any]:
+    """
+    Sort a list by scattering chunks to worker processes and merging the runs.
+
+    The list is split into one chunk per CPU, each chunk is sorted with
+    list.sort in a "spawn" worker, and the sorted runs are combined with a
+    stable k-way heapq.merge. Inputs shorter than _PARALLEL_MIN_N, or
+    machines with a single CPU, are sorted in this process instead. Items
+    must be picklable; pickling errors propagate unchanged.
+
+    Args:
+        arr: The list to sort (left unmodified).
+        reverse: If True, sort in descending order.
+
+    Returns:
+        A new sorted list.
+
+    Raises:
+        TypeError: If two elements cannot be compared.
+    """
+    n = len(arr)
+    workers = os.cpu_count() or 1
+    if n < _PARALLEL_MIN_N or workers < 2:
+        return _sort_chunk(reverse, list(arr))
+    # Deferred like the compiled kernels: only --algo merge on large inputs
+    # needs multiprocessing, so plain imports of this module skip its cost.
+    import multiprocessing
+    size = -(-n // workers)
+    chunks = [arr[i:i + size] for i in range(0, n, size)]
+    with multiprocessing.get_context("spawn").Pool(workers) as pool:
+        runs = pool.map(functools.partial(_sort_chunk, reverse), chunks)
+    try:
+        return list(heapq.merge(*runs, reverse=reverse))
+    except TypeError as exc:
+        raise TypeError(f"Cannot compare elements: {exc}") from exc
+
+def _insertion_sort(items: Iterable[Any], reverse: bool) -> Optional[List[Any]]:
+    """
+    Return a new sorted list built by binary insertion, or None on a TypeError.
+
+    insort places each item after any equal ones, which keeps ascending order
+    stable. Descending order uses insort_left, which places each item before
+    any equal ones, and then reverses the result, so equal items also keep
+    their original order. items is iterated exactly once.
+
+    Args:
+        items: The items to sort (left unmodified).
+        reverse: If True, sort in descending order.
+
+    Returns:
+        The sorted list, or None if two elements cannot be compared so the
+        caller can fall back to the bubble loop and its descriptive error.
+    """
+    result: List[Any] = []
+    insert = bisect.insort_left if reverse else bisect.insort
+    try:
+        for x in items:
+            insert(result, x)
+    except TypeError:
+        return None
+    if reverse:
+        result.reverse()
+    return result
+
+def _is_sorted(arr: List[Any], reverse: bool) -> bool:
+    """
+    Return True if arr is already in the requested order.
+
+    The pairwise scan runs inside the C-level all()/map() machinery rather
+    than a Python loop, and stops at the first out-of-order pair. islice
+    pairs each item with its successor without copying the list.
+    Incomparable elements report False so the caller's sort raises the
+    usual descriptive TypeError.
+    """
+    try:
+        return all(map(ge if reverse else le, arr, islice(arr, 1, None)))
+    except TypeError:
+        return False
+
+def _maybe_pack(arr: List[Any]) -> Optional["array.array"]:
+    """
+    Copy a homogeneous numeric list into an unboxed array.array.
+
+    Lists of only ints that fit in int64 become typecode 'q', lists of only
+    floats become 'd'. The compiled kernels sort these buffers directly; the
+    pure-Python loop keeps using the list, because indexing an array.array
+    boxes a fresh object on every read.
+
+    Args:
+        arr: The list to inspect.
+
+    Returns:
+        The packed copy, or None for bools, mixed types, or out-of-range ints.
+    """
+    if all(type(x) is int for x in arr):
+        try:
+            return array.array("q", arr)
+        except OverflowError:
+            return None
+    if all(type(x) is float for x in arr):
+        return array.array("d", arr)
+    return None
+
+@functools.lru_cache(maxsize=None)
+def _cython_sorter() -> Optional[Callable[["array.array", bool], None]]:
+    """
+    Return the Cython kernel (bubble_sort_c, built via setup.py), or None.
+
+    The import is attempted once and cached so a missing extension does not
+    cost a sys.path scan on every call.
+    """
+    try:
+        from bubble_sort_c import bubble_c
+    except ImportError:
+        return None
+    return bubble_c
+
+@functools.lru_cache(maxsize=None)
+def _numba_sorter() -> Optional[Callable[["array.array", bool], None]]:
+    """Return the Numba kernel, or None if numba/numpy are missing."""
+    try:
+        from _bubble_numba import sort_packed
+    except ImportError:
+        return None
+    return sort_packed
+
+def _compiled_sorter() -> Optional[Callable[["array.array", bool], None]]:
+    """
+    Return the compiled kernel to use, or None for the pure-Python loop.
+
+    The Cython extension loads in a couple of milliseconds and is always
+    preferred. Importing numba and loading the JIT kernel costs a few tenths
+    of a second, more than bubble-sorting _BUBBLE_MAX_N items in Python, so
+    the Numba kernel is only used once the caller has imported numba itself.
+    """
+    sorter = _cython_sorter()
+    if sorter is None and "numba" in sys.modules:
+        sorter = _numba_sorter()
+    return sorter
+
+# Both helpers are cocktail-shaker sorts: a forward pass carries the largest
+# unsorted item right, a backward pass carries the smallest left, and each
+# pass shrinks the window to its last swap, so small items near the end
+# ("turtles") no longer need one full pass per position.
+#
+# Each pass keeps the item being carried along in a local (cur), so every
+# step reads only one new element, and a swap writes two values without
+# re-reading either slot; arr[i] (or arr[i + 1] going backwards) always
+# equals cur, so the error message below still names the failing pair.
+#
+# The two helpers are deliberately duplicated rather than sharing a
+# "(a > b) ^ reverse" test, which would build and XOR a bool on every
+# comparison. The try block sits outside the loops so the hot path carries
+# no per-iteration exception handling.
+
+def _bubble_asc(arr: List[Any]) -> None:
+    """Cocktail-shaker sort arr in place in ascending order."""
+    lo, hi = 0, len(arr) - 1
+    i = 0
+    try:
+        while lo < hi:
+            last = lo
+            cur = arr[lo]
+            for i in range(lo, hi):
+                nxt = arr[i + 1]
+                if cur > nxt:
+                    arr[i] = nxt
+                    arr[i + 1] = cur
+                    last = i
+                else:
+                    cur = nxt
+            hi = last
+            last = hi
+            cur = arr[hi]
+            for i in range(hi - 1, lo - 1, -1):
+                prv = arr[i]
+                if prv > cur:
+                    arr[i + 1] = prv
+                    arr[i] = cur
+                    last = i + 1
+                else:
+                    cur = prv
+            lo = last
+    except TypeError as exc:
+        raise TypeError(f"Cannot compare {arr[i]!r} and {arr[i+1]!r}") from exc
+
+def _bubble_desc(arr: List[Any]) -> None:
+    """Cocktail-shaker sort arr in place in descending order."""
+    lo, hi = 0, len(arr) - 1
+    i = 0
+    try:
+        while lo < hi:
+            last = lo
+            cur = arr[lo]
+            for i in range(lo, hi):
+                nxt = arr[i + 1]
+                if cur < nxt:
+                    arr[i] = nxt
+                    arr[i + 1] = cur
+                    last = i
+                else:
+                    cur = nxt
+            hi = last
+            last = hi
+            cur = arr[hi]
+            for i in range(hi - 1, lo - 1, -1):
+                prv = arr[i]
+                if prv < cur:
+                    arr[i + 1] = prv
+                    arr[i] = cur
+                    last = i + 1
+                else:
+                    cur = prv
+            lo = last
+    except TypeError as exc:
+        raise TypeError(f"Cannot compare {arr[i]!r} and {arr[i+1]!r}") from exc
+
 def bubble_sort_in_place(arr: List[Any], *, reverse: bool = False) -> List[Any]:
     """
     Sort a list in place using the bubble sort algorithm.
 
-    The algorithm is stable and has O(n^2) worst-case time complexity. This
-    function mutates the provided list and also returns it for convenience.
+    The algorithm is stable and has O(n^2) worst-case time complexity. Lists
+    longer than _BUBBLE_MAX_N are sorted with the built-in Timsort instead,
+    which produces the same (stable) order in O(n log n). When the Cython
+    extension is built, or numba has already been imported, lists holding
+    only ints or only floats run through a compiled kernel. This function
+    mutates the provided list and also returns it for convenience.
 
     Args:
         arr: A list of comparable items to sort.
@@ -58,17 +346,24 @@ def bubble_sort_in_place(arr: List[Any], *, reverse: bool = False) -> List[Any]:
     if not isinstance(arr, list):
         raise TypeError("bubble_sort_in_place requires a list for in-place sorting.")
     n = len(arr)
-    for end in range(n - 1, 0, -1):
-        swapped = False
-        for i in range(end):
-            try:
-                if (arr[i] > arr[i + 1]) ^ reverse:
-                    arr[i], arr[i + 1] = arr[i + 1], arr[i]
-                    swapped = True
-            except TypeError as exc:
-                raise TypeError(f"Cannot compare {arr[i]!r} and {arr[i+1]!r}") from exc
-        if not swapped:
-            break
+    if n > _BUBBLE_MAX_N:
+        _timsort_in_place(arr, reverse)
+        return arr
+    if _is_sorted(arr, reverse):
+        return arr
+    if n >= _COMPILED_MIN_N:
+        sorter = _compiled_sorter()
+        packed = _maybe_pack(arr) if sorter is not None else None
+        if packed is not None:
+            sorter(packed, reverse)
+            # Slice assignment keeps the caller's list object (and the
+            # list return type) while refilling it from the sorted buffer.
+            arr[:] = packed
+            return arr
+    if reverse:
+        _bubble_desc(arr)
+    else:
+        _bubble_asc(arr)
     return arr
 
 def bubble_sort(sequence: Iterable[Any], *, reverse: bool = False, in_place: bool = False) -> List[Any]:
@@ -77,7 +372,8 @@ def bubble_sort(sequence: Iterable[Any], *, reverse: bool = False, in_place: boo
 
     This wrapper accepts any iterable; when in_place is True it requires
     a list and will sort it directly. When in_place is False (default), a new
-    list copy is created and sorted, leaving the original iterable untouched.
+    list copy is created and sorted, leaving the original iterable untouched;
+    copies of up to _SMALL_N items are built by binary insertion instead.
 
     Args:
         sequence: Iterable of comparable items.
@@ -90,22 +386,39 @@ def bubble_sort(sequence: Iterable[Any], *, reverse: bool = False, in_place: boo
     Raises:
         TypeError: If sequence is not iterable, or if in_place=True and sequence is not a list.
     """
-    if not hasattr(sequence, "__iter__"):
-        raise TypeError("sequence must be iterable")
+    try:
+        it = iter(sequence)
+    except TypeError as exc:
+        raise TypeError("sequence must be iterable") from exc
     if in_place:
         # caller asserts it's a list for in-place sorting; bubble_sort_in_place will validate
         return bubble_sort_in_place(sequence, reverse=reverse)  # type: ignore[arg-type]
-    return bubble_sort_in_place(list(sequence), reverse=reverse)
+    # Sized inputs are measured without copying, so small ones are inserted
+    # straight into the result list; only unsized iterators and the bubble
+    # path need an intermediate list.
+    items = sequence if isinstance(sequence, Sized) else list(it)
+    if len(items) <= _SMALL_N:
+        result = _insertion_sort(items, reverse)
+        if result is not None:
+            return result
+    if items is sequence:
+        items = list(items)
+    return bubble_sort_in_place(items, reverse=reverse)
 
 def _cli(argv: List[str]) -> int:
     """
     Minimal command-line interface.
 
     Accepts positional items or prompts interactively (comma-separated).
+    --algo picks the sort: the built-in Timsort (default), the bubble sort,
+    or the multiprocessing merge sort.
+
     Returns:
         Exit code (0 success, 1 user/input error, 2 comparison error).
     """
-    p = argparse.ArgumentParser(description="Bubble sort (concise).")
+    p = argparse.ArgumentParser(description="Sort items (Timsort, bubble or merge sort).")
+    p.add_argument("--algo", choices=["sorted", "bubble", "merge"], default="sorted",
+                   help="Sorting algorithm (default: sorted, Python's built-in Timsort).")
     p.add_argument("items", nargs="*", help="Items to sort (space separated).")
     p.add_argument("-r", "--reverse", action="store_true", help="Sort descending.")
     p.add_argument("-v", "--verbose", action="store_true", help="Show original + sorted.")
@@ -118,18 +431,31 @@ def _cli(argv: List[str]) -> int:
             return 1
         if not raw:
             return 1
-        tokens = [t for t in raw.split(",")]
+        # csv splits (and honours "quoted, items") in C; trailing spaces are
+        # still trimmed by _parse_token. Lines csv rejects (stray carriage
+        # returns, oversized fields) are split on plain commas instead.
+        try:
+            tokens = next(csv.reader([raw], skipinitialspace=True))
+        except csv.Error:
+            tokens = raw.split(",")
     else:
         tokens = args.items
 
     items = [_parse_token(t) for t in tokens]
     try:
-        out = bubble_sort(items, reverse=args.reverse, in_place=False)
+        if args.algo == "bubble":
+            out = bubble_sort(items, reverse=args.reverse, in_place=False)
+        elif args.algo == "merge":
+            out = _parallel_sort(items, args.reverse)
+        else:
+            out = list(items)
+            _timsort_in_place(out, args.reverse)
     except TypeError as exc:
         print(f"Error: {exc}", file=sys.stderr)
         return 2
 
     if args.verbose:
+        print("Algorithm:", args.algo)
         print("Original:", items)
         print("Sorted:  ", out)
     else:
@@ -0,0 +1,50 @@
+# bubble_sort_c.pyx
+# cython: language_level=3, boundscheck=False, wraparound=False
+
+"""
+Optional Cython build of the cocktail-shaker bubble sort used by
+bubble_sort_in_place.
+
+Build it next to bubble_sort.py with:
+
+    python setup.py build_ext --inplace
+
+bubble_sort.py picks it up automatically when the compiled module is
+importable and falls back to Numba or pure Python otherwise.
+"""
+
+ctypedef fused number:
+    long long
+    double
+
+def bubble_c(number[::1] a, bint reverse):
+    """
+    Sort an int64 ('q') or float64 ('d') buffer in place, e.g. an array.array.
+
+    Strict comparisons keep the sort stable; reverse=True sorts descending.
+    The GIL is released while the loop runs.
+    """
+    with nogil:
+        _bubble(a, reverse)
+
+cdef void _bubble(number[::1] a, bint reverse) noexcept nogil:
+    """Cocktail-shaker passes over a typed memoryview; see bubble_c."""
+    cdef Py_ssize_t lo = 0, hi = a.shape[0] - 1, last, i
+    cdef number t
+    while lo < hi:
+        last = lo
+        for i in range(lo, hi):
+            if (a[i] < a[i + 1]) if reverse else (a[i] > a[i + 1]):
+                t = a[i]
+                a[i] = a[i + 1]
+                a[i + 1] = t
+                last = i
+        hi = last
+        last = hi
+        for i in range(hi - 1, lo - 1, -1):
+            if (a[i] < a[i + 1]) if reverse else (a[i] > a[i + 1]):
+                t = a[i]
+                a[i] = a[i + 1]
+                a[i + 1] = t
+                last = i + 1
+        lo = last
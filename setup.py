@@ -0,0 +1,26 @@
+# setup.py
+
+"""
+Build script for the optional Cython kernel (bubble_sort_c.pyx).
+
+    pip install cython
+    python setup.py build_ext --inplace
+
+bubble_sort.py works without it; the compiled module only speeds up
+bubble_sort_in_place on lists of ints or floats. Without Cython installed
+the package still installs, just without the extension.
+"""
+from setuptools import setup
+
+try:
+    from Cython.Build import cythonize
+except ImportError:
+    ext_modules = []
+else:
+    ext_modules = cythonize("bubble_sort_c.pyx")
+
+setup(
+    name="bubble-sort",
+    py_modules=["bubble_sort", "_bubble_numba"],
+    ext_modules=ext_modules,
+)